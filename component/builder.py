@@ -86,7 +86,7 @@ class ComponentBuilder(models.AbstractModel):
 
         :param module: the name of the addon for which we want to load
                        the components
-        :type module: str | unicode
+        :type module: str
         :param registry: the registry in which we want to put the Component
         :type registry: :py:class:`~.core.ComponentRegistry`
         """
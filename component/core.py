@@ -18,10 +18,10 @@ The most common classes used publicly are:
 
 import logging
 import operator
-from collections import OrderedDict, defaultdict
+from collections import defaultdict
 
 from odoo import models
-from odoo.tools import LastOrderedSet, OrderedSet
+from odoo.tools import OrderedSet, lazy_property
 
 from .exception import NoComponentError, RegistryNotReadyError, SeveralComponentError
 
@@ -36,7 +36,8 @@ except ImportError:
 # The Cache size represents the number of items, so the number
 # of components (include abstract components) we will keep in the LRU
 # cache. We would need stats to know what is the average but this is a bit
-# early.
+# early. The components resolved by WorkContext.component() are kept in the
+# same cache, so they share (and evict) these slots with the lookups.
 DEFAULT_CACHE_SIZE = 512
 
 
@@ -56,6 +57,11 @@ def _get_addon_name(full_name):
     return addon_name
 
 
+# marks the keys of the components resolved by WorkContext.component() in the
+# cache of the registry, so they can't clash with the keys of the lookups
+_RESOLVED_COMPONENT = object()
+
+
 class ComponentDatabases(dict):
     """Holds a registry of components for each database"""
 
@@ -65,8 +71,9 @@ class ComponentRegistry:
 
     The key is the ``_name`` of the components.
 
-    This is an OrderedDict, because we want to keep the registration order of
-    the components, addons loaded first have their components found first.
+    The components are kept in a dict, which preserves the insertion order,
+    because we want to keep the registration order of the components, addons
+    loaded first have their components found first.
 
     The :attr:`ready` attribute must be set to ``True`` when all the components
     are loaded.
@@ -75,15 +82,36 @@ class ComponentRegistry:
 
     def __init__(self, cachesize=DEFAULT_CACHE_SIZE):
         self._cache = LRUCache(maxsize=cachesize)
-        self._components = OrderedDict()
+        self._components = {}
+        # non-abstract components only, the only ones returned by lookups
+        self._concrete = {}
         self._loaded_modules = set()
         self.ready = False
+        # inverted indexes of the concrete components, built on the first
+        # lookup following a change in the registry
+        self._indexed = False
+        # whether any concrete component has no _collection
+        self._has_generic = False
+        self._positions = {}
+        self._any_model = frozenset()
+        self._by_model = {}
+        self._by_collection = {}
+        self._by_usage = {}
+        self._by_collection_usage = {}
 
     def __getitem__(self, key):
         return self._components[key]
 
     def __setitem__(self, key, value):
         self._components[key] = value
+        if value._abstract:
+            self._concrete.pop(key, None)
+        else:
+            self._concrete[key] = value
+        self._indexed = False
+        # an extension may change how the component is resolved, for instance
+        # by adding a _component_match
+        self._clear_resolved_components()
 
     def __contains__(self, key):
         return key in self._components
@@ -97,9 +125,100 @@ class ComponentRegistry:
     def load_components(self, module):
         if module in self._loaded_modules:
             return
-        for component_class in MetaComponent._modules_components[module]:
+        # most addons have no components, do not add an empty list for them
+        # in the defaultdict
+        for component_class in MetaComponent._modules_components.get(module, ()):
             component_class._build_component(self)
         self._loaded_modules.add(module)
+        # new components may now match lookups already cached
+        self.clear_cache()
+
+    def clear_cache(self):
+        """Clear the cache of the lookups"""
+        self._cache.clear()
+        self._indexed = False
+
+    def _get_resolved_component(self, collection_name, usage, model_name):
+        """Return the component class resolved earlier for a lookup, if any"""
+        return self._cache.get(
+            (_RESOLVED_COMPONENT, collection_name, usage, model_name)
+        )
+
+    def _clear_resolved_components(self):
+        """Forget the component classes resolved by WorkContext.component()"""
+        if not self._cache:
+            return
+        resolved_keys = [
+            key for key in self._cache if key and key[0] is _RESOLVED_COMPONENT
+        ]
+        for key in resolved_keys:
+            self._cache.pop(key, None)
+
+    def _set_resolved_component(
+        self, collection_name, usage, model_name, component_class
+    ):
+        """Keep the component class resolved for a lookup
+
+        It is kept only when the resolution does not depend on the work
+        context, that is when none of the candidates of the lookup has its own
+        ``_component_match``.
+        """
+        candidates = self.lookup(collection_name, usage, model_name)
+        if all(_uses_default_match(component) for component in candidates):
+            key = (_RESOLVED_COMPONENT, collection_name, usage, model_name)
+            self._cache[key] = component_class
+
+    def _build_index(self):
+        """Index the concrete components by collection and usage
+
+        The indexes are not updated in :meth:`__setitem__` because the
+        ``_collection`` or ``_usage`` of a component can still change when one
+        of its parents is extended afterwards with ``_inherit``.
+
+        Every list of the indexes keeps the registration order of the
+        components.
+        """
+        concrete = self._concrete.values()
+        by_collection = defaultdict(list)
+        by_usage = defaultdict(list)
+        by_collection_usage = defaultdict(list)
+        any_model = set()
+        by_model = defaultdict(set)
+        for component in concrete:
+            collection = component._collection
+            usage = component._usage
+            by_collection[collection].append(component)
+            by_usage[usage].append(component)
+            by_collection_usage[(collection, usage)].append(component)
+            apply_on_models = component.apply_on_models
+            # None means all models
+            if apply_on_models is None:
+                any_model.add(component)
+            else:
+                for model_name in apply_on_models:
+                    by_model[model_name].add(component)
+        self._positions = {component: idx for idx, component in enumerate(concrete)}
+        self._any_model = frozenset(any_model)
+        self._by_model = {
+            model_name: frozenset(components)
+            for model_name, components in by_model.items()
+        }
+        self._has_generic = None in by_collection
+        self._by_collection = dict(by_collection)
+        self._by_usage = dict(by_usage)
+        self._by_collection_usage = dict(by_collection_usage)
+        self._indexed = True
+
+    def _merge_candidates(self, components, generic_components):
+        """Merge components of a collection with the generic ones
+
+        The result follows the registration order of the components.
+        """
+        if not generic_components:
+            return components
+        if not components:
+            return generic_components
+        return sorted(components + generic_components, key=self._positions.__getitem__)
 
     @cachedmethod(operator.attrgetter("_cache"))
     def lookup(self, collection_name=None, usage=None, model_name=None):
@@ -132,36 +251,33 @@ class ComponentRegistry:
 
         """
 
-        # keep the order so addons loaded first have components used first
-        candidates = (
-            component
-            for component in self._components.values()
-            if not component._abstract
-        )
+        if not self._indexed:
+            self._build_index()
 
-        if collection_name is not None:
-            candidates = (
-                component
-                for component in candidates
-                if (
-                    component._collection == collection_name
-                    or component._collection is None
+        # keep the order so addons loaded first have components used first
+        if collection_name is None:
+            if usage is None:
+                candidates = self._concrete.values()
+            else:
+                candidates = self._by_usage.get(usage, [])
+        elif usage is None:
+            candidates = self._by_collection.get(collection_name, [])
+            if self._has_generic:
+                candidates = self._merge_candidates(
+                    candidates, self._by_collection.get(None, [])
+                )
+        else:
+            candidates = self._by_collection_usage.get((collection_name, usage), [])
+            if self._has_generic:
+                candidates = self._merge_candidates(
+                    candidates, self._by_collection_usage.get((None, usage), [])
                 )
-            )
-
-        if usage is not None:
-            candidates = (
-                component for component in candidates if component._usage == usage
-            )
-
-        if model_name is not None:
-            candidates = (
-                c
-                for c in candidates
-                if c.apply_on_models is None or model_name in c.apply_on_models
-            )
 
-        return list(candidates)
+        if model_name is None:
+            return list(candidates)
+        any_model = self._any_model
+        model_components = self._by_model.get(model_name, frozenset())
+        return [c for c in candidates if c in any_model or c in model_components]
 
 
 # We will store a ComponentRegistry per database here,
@@ -222,9 +338,13 @@ class WorkContext:
         with collection.work_on('res.partner', hello='world') as work:
             assert work.hello == 'world'
 
-    When you need to work on a different model, a new work instance will be
-    created for you when you are using the high-level API. This is what
-    happens under the hood:
+    When you need to work on a different model, the high-level API
+    (:meth:`component`, :meth:`many_components` and
+    :meth:`component_by_name`) creates a work instance for this model the
+    first time, then reuses it for the next components of the same model.
+    The components of another model obtained from a work instance therefore
+    share the same ``work``: an attribute one of them sets on ``self.work``
+    is seen by the others. This is what happens under the hood:
 
     ::
 
@@ -236,20 +356,41 @@ class WorkContext:
             # => spawn a new WorkContext with a copy of the attributes
             assert work2.model_name == 'res.users'
             assert work2.hello == 'world'
+            comp = work.component(usage='record.importer',
+                                  model_name='res.users')
+            # => the first time, spawn a new WorkContext kept for the
+            # next components of 'res.users'
+            comp2 = work.component(usage='record.importer',
+                                   model_name='res.users')
+            assert comp.work is comp2.work
 
     """
 
+    #: Whether :meth:`component` can reuse the component class it resolved
+    #: earlier for the same collection, usage and model. It is only the case
+    #: when the resolution methods are the ones of :class:`WorkContext`, as
+    #: an override could depend on the attributes of the work context.
+    _reuse_resolved_component = True
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._reuse_resolved_component = all(
+            getattr(cls, method_name) is getattr(WorkContext, method_name)
+            for method_name in _RESOLUTION_METHODS
+        )
+
     def __init__(
         self, model_name=None, collection=None, components_registry=None, **kwargs
     ):
         self.collection = collection
         self.model_name = model_name
-        self.model = self.env[model_name]
+        env = self.env
+        self.model = env[model_name]
         # lookup components in an alternative registry, used by the tests
         if components_registry is not None:
             self.components_registry = components_registry
         else:
-            dbname = self.env.cr.dbname
+            dbname = env.cr.dbname
             try:
                 self.components_registry = _component_databases[dbname]
             except KeyError as exc:
@@ -264,6 +405,7 @@ class WorkContext:
                 )
                 raise RegistryNotReadyError(msg) from exc
         self._propagate_kwargs = ["collection", "model_name", "components_registry"]
+        self._work_on_cache = {}
         for attr_name, value in kwargs.items():
             setattr(self, attr_name, value)
             self._propagate_kwargs.append(attr_name)
@@ -290,6 +432,20 @@ class WorkContext:
             kwargs["model_name"] = model_name
         return self.__class__(**kwargs)
 
+    def _work_on_model(self, model_name):
+        """Return a work context for another model, used for lookups
+
+        The work contexts created for the lookups on other models are kept,
+        so getting many components of another model (e.g. one per record)
+        does not create as many work contexts. The attributes propagated to
+        them are the ones of the current work context when they are created.
+        """
+        try:
+            return self._work_on_cache[model_name]
+        except KeyError:
+            work_context = self._work_on_cache[model_name] = self.work_on(model_name)
+            return work_context
+
     def _component_class_by_name(self, name):
         components_registry = self.components_registry
         component_class = components_registry.get(name)
@@ -315,7 +471,8 @@ class WorkContext:
         argument.
 
         """
-        if isinstance(model_name, models.BaseModel):
+        # model names are strings most of the time, cheaper to check first
+        if type(model_name) is not str and isinstance(model_name, models.BaseModel):
             model_name = model_name._name
         component_class = self._component_class_by_name(name)
         work_model = model_name or self.model_name
@@ -328,14 +485,12 @@ class WorkContext:
                 % (name, self.collection._name)
             )
 
-        if (
-            component_class.apply_on_models
-            and work_model not in component_class.apply_on_models
-        ):
-            if len(component_class.apply_on_models) == 1:
-                hint_models = "'{}'".format(component_class.apply_on_models[0])
+        apply_on_models = component_class.apply_on_models
+        if apply_on_models and work_model not in apply_on_models:
+            if len(apply_on_models) == 1:
+                hint_models = "'{}'".format(apply_on_models[0])
             else:
-                hint_models = "<one of {!r}>".format(component_class.apply_on_models)
+                hint_models = "<one of {!r}>".format(apply_on_models)
             raise NoComponentError(
                 "Component with name '%s' can't be used for model '%s'.\n"
                 "Hint: you might want to use: "
@@ -346,15 +501,19 @@ class WorkContext:
         if work_model == self.model_name:
             work_context = self
         else:
-            work_context = self.work_on(model_name)
+            work_context = self._work_on_model(model_name)
         return component_class(work_context)
 
     def _lookup_components(self, usage=None, model_name=None, **kw):
+        # positional arguments: cheaper to hash in the key of the lookup cache
         component_classes = self.components_registry.lookup(
-            self.collection._name, usage=usage, model_name=model_name
+            self.collection._name, usage, model_name
         )
         matching_components = []
         for cls in component_classes:
+            if _uses_default_match(cls):
+                matching_components.append(cls)
+                continue
             try:
                 matching = cls._component_match(
                     self, usage=usage, model_name=model_name, **kw
@@ -385,7 +544,8 @@ class WorkContext:
 
     def _ensure_model_name(self, model_name):
         """Make sure model name is a string or fallback to current ctx value."""
-        if isinstance(model_name, models.BaseModel):
+        # model names are strings most of the time, cheaper to check first
+        if type(model_name) is not str and isinstance(model_name, models.BaseModel):
             model_name = model_name._name
         return model_name or self.model_name
 
@@ -397,7 +557,7 @@ class WorkContext:
         if model_name == self.model_name:
             work_context = self
         else:
-            work_context = self.work_on(model_name)
+            work_context = self._work_on_model(model_name)
         return component_classes, work_context
 
     def component(self, usage=None, model_name=None, **kw):
@@ -424,6 +584,16 @@ class WorkContext:
 
         """
         model_name = self._ensure_model_name(model_name)
+        reuse_resolved = not kw and self._reuse_resolved_component
+        if reuse_resolved:
+            # most of the lookups always resolve to the same component
+            component_class = self.components_registry._get_resolved_component(
+                self.collection._name, usage, model_name
+            )
+            if component_class is not None:
+                if model_name == self.model_name:
+                    return component_class(self)
+                return component_class(self._work_on_model(model_name))
         component_classes, work_context = self._matching_components(
             usage=usage, model_name=model_name, **kw
         )
@@ -453,7 +623,12 @@ class WorkContext:
                     component_classes,
                 )
             )
-        return component_classes[0](work_context)
+        component_class = component_classes[0]
+        if reuse_resolved:
+            self.components_registry._set_resolved_component(
+                self.collection._name, usage, model_name, component_class
+            )
+        return component_class(work_context)
 
     def many_components(self, usage=None, model_name=None, **kw):
         """Find many components by usage and model for the current collection
@@ -478,6 +653,16 @@ class WorkContext:
     __repr__ = __str__
 
 
+# methods of WorkContext used to resolve a component in
+# WorkContext.component(), see WorkContext._reuse_resolved_component
+_RESOLUTION_METHODS = (
+    "_matching_components",
+    "_lookup_components",
+    "_filter_components_by_collection",
+    "_filter_components_by_model",
+)
+
+
 class MetaComponent(type):
     """Metaclass for Components
 
@@ -719,17 +904,20 @@ class AbstractComponent(metaclass=MetaComponent):
         """
         return True
 
-    @property
+    # the work context of a component does not change during its lifetime,
+    # so these attributes are computed once per component instance
+
+    @lazy_property
     def collection(self):
         """Collection we are working with"""
         return self.work.collection
 
-    @property
+    @lazy_property
     def env(self):
         """Current Odoo environment, the one of the collection record"""
         return self.work.env
 
-    @property
+    @lazy_property
     def model(self):
         """The model instance we are working with"""
         return self.work.model
@@ -829,7 +1017,7 @@ class AbstractComponent(metaclass=MetaComponent):
         elif parents is None:
             parents = []
 
-        if cls._name in registry and not parents:
+        if not parents and cls._name in registry:
             raise TypeError(
                 "Component %r (in class %r) already exists. "
                 "Consider using _inherit instead of _name "
@@ -848,9 +1036,9 @@ class AbstractComponent(metaclass=MetaComponent):
 
         # create or retrieve the component's class
         if name in parents:
-            if name not in registry:
+            ComponentClass = registry.get(name)
+            if ComponentClass is None:
                 raise TypeError("Component %r does not exist in registry." % name)
-            ComponentClass = registry[name]
             ComponentClass._build_component_check_base(cls)
             check_parent = ComponentClass._build_component_check_parent
         else:
@@ -866,21 +1054,25 @@ class AbstractComponent(metaclass=MetaComponent):
             )
             check_parent = cls._build_component_check_parent
 
-        # determine all the classes the component should inherit from
-        bases = LastOrderedSet([cls])
+        # determine all the classes the component should inherit from,
+        # an ordered dict used as a set where a class added again moves to
+        # the end (same ordering than odoo.tools.LastOrderedSet)
+        bases = {cls: None}
         for parent in parents:
-            if parent not in registry:
+            parent_class = registry.get(parent)
+            if parent_class is None:
                 raise TypeError(
                     "Component %r inherits from non-existing component %r."
                     % (name, parent)
                 )
-            parent_class = registry[parent]
             if parent == name:
                 for base in parent_class.__bases__:
-                    bases.add(base)
+                    bases.pop(base, None)
+                    bases[base] = None
             else:
                 check_parent(cls, parent_class)
-                bases.add(parent_class)
+                bases.pop(parent_class, None)
+                bases[parent_class] = None
                 parent_class._inherit_children.add(name)
         ComponentClass.__bases__ = tuple(bases)
 
@@ -924,6 +1116,18 @@ class AbstractComponent(metaclass=MetaComponent):
         """
 
 
+def _uses_default_match(component_class):
+    """Return whether a component keeps the default ``_component_match``
+
+    The default one accepts every candidate, so there is no need to call it.
+    """
+    match = getattr(component_class._component_match, "__func__", None)
+    return match is _default_component_match
+
+
+_default_component_match = AbstractComponent._component_match.__func__
+
+
 class Component(AbstractComponent):
     """Concrete Component class
 
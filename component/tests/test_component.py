@@ -3,7 +3,7 @@
 
 from contextlib import contextmanager
 
-from odoo.addons.component.core import Component
+from odoo.addons.component.core import Component, WorkContext
 from odoo.addons.component.exception import NoComponentError, SeveralComponentError
 
 from .common import TransactionComponentRegistryCase
@@ -152,6 +152,30 @@ class TestComponent(TransactionComponentRegistryCase):
             self.assertEqual("res.partner", base.work.model_name)
             self.assertEqual("res.users", comp.work.model_name)
 
+    def test_component_by_usage_other_model_reuse_work(self):
+        """Components of another model share the same WorkContext"""
+        with self.get_base() as base:
+            comp = base.component(usage="for.test", model_name="res.users")
+            comp2 = base.component(usage="for.test", model_name="res.users")
+            self.assertIsNot(comp, comp2)
+            self.assertIs(comp.work, comp2.work)
+            comp3 = base.component_by_name("component2", model_name="res.users")
+            self.assertIs(comp.work, comp3.work)
+            # work_on() still creates a new WorkContext
+            self.assertIsNot(comp.work, base.work.work_on("res.users"))
+
+    def test_component_other_model_shared_work(self):
+        """Components of another model see the state set on their work"""
+        with self.get_base() as base:
+            comp = base.component(usage="for.test", model_name="res.users")
+            # sharing the WorkContext of a model is intended, a component
+            # can leave data on it for the next components of this model
+            comp.work.state = "set by comp"
+            comp2 = base.many_components(usage="for.test", model_name="res.users")[0]
+            self.assertEqual("set by comp", comp2.work.state)
+            # but it does not leak to the work of the current model
+            self.assertFalse(hasattr(base.work, "state"))
+
     def test_component_by_usage_other_model_env(self):
         """Use component(usage=...) on a different model (instance)"""
         with self.get_base() as base:
@@ -386,3 +410,99 @@ class TestComponent(TransactionComponentRegistryCase):
             # _component_match method
             comp = base.component(usage="speaker", model_name=self.env["res.partner"])
             self.assertEqual("bar", comp._name)
+
+    def test_component_match_work_context(self):
+        """Lookup with match method depending on the work context"""
+
+        class Foo(Component):
+            _name = "foo"
+            _collection = "collection.base"
+            _usage = "speaker"
+
+            @classmethod
+            def _component_match(cls, work, **kw):
+                return work.speaker == "foo"
+
+        class Bar(Component):
+            _name = "bar"
+            _collection = "collection.base"
+            _usage = "speaker"
+
+            @classmethod
+            def _component_match(cls, work, **kw):
+                return work.speaker == "bar"
+
+        self._build_components(Foo, Bar)
+
+        # the component found must not be reused for another work context
+        for speaker in ("foo", "bar", "foo"):
+            with self.collection_record.work_on(
+                "res.partner",
+                components_registry=self.comp_registry,
+                speaker=speaker,
+            ) as work:
+                self.assertEqual(speaker, work.component(usage="speaker")._name)
+
+    def test_component_work_context_override(self):
+        """Lookup with a WorkContext overriding the resolution of components"""
+
+        class Foo(Component):
+            _name = "foo"
+            _collection = "collection.base"
+            _usage = "speaker"
+
+        class Bar(Component):
+            _name = "bar"
+            _collection = "collection.base"
+            _usage = "speaker"
+
+        self._build_components(Foo, Bar)
+
+        class SpeakerWorkContext(WorkContext):
+            def _lookup_components(self, usage=None, model_name=None, **kw):
+                components = super()._lookup_components(
+                    usage=usage, model_name=model_name, **kw
+                )
+                return [c for c in components if c._name == self.speaker]
+
+        # the override must be used on every lookup
+        for speaker in ("foo", "bar", "foo"):
+            work = SpeakerWorkContext(
+                model_name="res.partner",
+                collection=self.collection_record,
+                components_registry=self.comp_registry,
+                speaker=speaker,
+            )
+            self.assertEqual(speaker, work.component(usage="speaker")._name)
+        # and its result not reused for a plain WorkContext
+        work = WorkContext(
+            model_name="res.partner",
+            collection=self.collection_record,
+            components_registry=self.comp_registry,
+        )
+        with self.assertRaises(SeveralComponentError):
+            work.component(usage="speaker")
+
+    def test_component_match_added_by_extension(self):
+        """A _component_match added after a lookup is used"""
+
+        class Foo(Component):
+            _name = "foo"
+            _collection = "collection.base"
+            _usage = "speaker"
+
+        self._build_components(Foo)
+
+        with self.get_base() as base:
+            self.assertEqual("foo", base.component(usage="speaker")._name)
+
+            class FooNoMatch(Component):
+                _inherit = "foo"
+
+                @classmethod
+                def _component_match(cls, work, **kw):
+                    return False
+
+            self._build_components(FooNoMatch)
+            with self.assertRaises(NoComponentError):
+                base.component(usage="speaker")
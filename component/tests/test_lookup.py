@@ -1,7 +1,7 @@
 # Copyright 2017 Camptocamp SA
 # License LGPL-3.0 or later (http://www.gnu.org/licenses/lgpl.html)
 
-from odoo.addons.component.core import AbstractComponent, Component
+from odoo.addons.component.core import AbstractComponent, Component, MetaComponent
 
 from .common import TransactionComponentRegistryCase
 
@@ -77,6 +77,46 @@ class TestLookup(TransactionComponentRegistryCase):
         components = self.comp_registry.lookup("foobar", usage="speaker")
         self.assertEqual(["foo", "bar"], [c._name for c in components])
 
+    def test_lookup_generic_components(self):
+        """Lookup components without collection, keeping registration order"""
+
+        class Foo(Component):
+            _name = "foo"
+            _collection = "foobar"
+            _usage = "speaker"
+
+        class Generic(Component):
+            # no collection, can be used in any collection
+            _name = "generic"
+            _usage = "speaker"
+
+        class Bar(Component):
+            _name = "bar"
+            _collection = "foobar"
+            _usage = "speaker"
+
+        class Homer(Component):
+            _name = "homer"
+            _collection = "other"
+            _usage = "speaker"
+
+        self._build_components(Foo, Generic, Bar, Homer)
+
+        components = self.comp_registry.lookup("foobar", usage="speaker")
+        self.assertEqual(["foo", "generic", "bar"], [c._name for c in components])
+
+        components = self.comp_registry.lookup("other", usage="speaker")
+        self.assertEqual(["generic", "homer"], [c._name for c in components])
+
+        components = self.comp_registry.lookup("foobar")
+        self.assertEqual(["foo", "generic", "bar"], [c._name for c in components])
+
+        # no collection given: components of any collection
+        components = self.comp_registry.lookup(usage="speaker")
+        self.assertEqual(
+            ["foo", "generic", "bar", "homer"], [c._name for c in components]
+        )
+
     def test_lookup_no_component(self):
         """No component"""
         # we just expect an empty list when no component match, the error
@@ -190,3 +230,36 @@ class TestLookup(TransactionComponentRegistryCase):
         # now we should find them both as the cache has been cleared
         components = self.comp_registry.lookup("foobar")
         self.assertEqual(["foo", "bar"], [c._name for c in components])
+
+        class Baz(Component):
+            _name = "baz"
+            _collection = "foobar"
+
+        self._build_components(Baz)
+        self.comp_registry.clear_cache()
+        components = self.comp_registry.lookup("foobar")
+        self.assertEqual(["foo", "bar", "baz"], [c._name for c in components])
+
+    def test_lookup_cache_load_components(self):
+        """Loading the components of a module clears the lookup cache"""
+
+        class Foo(Component):
+            _name = "foo"
+            _collection = "foobar"
+
+        self._build_components(Foo)
+
+        components = self.comp_registry.lookup("foobar")
+        self.assertEqual(["foo"], [c._name for c in components])
+
+        class Bar(Component):
+            _name = "bar"
+            _collection = "foobar"
+
+        # components declared in tests are not added by the metaclass, add it
+        # for a fake module ('_teardown_registry' restores the original ones)
+        MetaComponent._modules_components["fake_module"].append(Bar)
+        self.comp_registry.load_components("fake_module")
+
+        components = self.comp_registry.lookup("foobar")
+        self.assertEqual(["foo", "bar"], [c._name for c in components])
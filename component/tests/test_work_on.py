@@ -71,3 +71,18 @@ class TestWorkOn(TransactionComponentRegistryCase):
         self.assertIs(registry, work2.components_registry)
         # test_keyword has been propagated to the new WorkContext instance
         self.assertEqual("value", work2.test_keyword)
+
+    def test_propagate_work_on_current_values(self):
+        """Attributes are propagated with their current values"""
+        work = WorkContext(
+            model_name="res.partner",
+            collection=self.collection,
+            components_registry=ComponentRegistry(),
+            test_keyword="value",
+        )
+        work.test_keyword = "before"
+        self.assertEqual("before", work.work_on("res.users").test_keyword)
+        # a lookup on another model spawns a work context as well
+        work.many_components(usage="for.test", model_name="res.users")
+        work.test_keyword = "after"
+        self.assertEqual("after", work.work_on("res.users").test_keyword)
@@ -220,7 +220,7 @@ class EventCollecter(Component):
     @classmethod
     def _complete_component_build(cls):
         """Create a cache on the class when the component is built"""
-        super(EventCollecter, cls)._complete_component_build()
+        super()._complete_component_build()
         # the _cache being on the component class, which is
         # dynamically rebuild when odoo registry is rebuild, we
         # are sure that the result is always the same for a lookup
@@ -293,6 +293,6 @@ class EventListener(AbstractComponent):
 
     @classmethod
     def _complete_component_build(cls):
-        super(EventListener, cls)._complete_component_build()
+        super()._complete_component_build()
         cls._build_event_listener_component()
         return
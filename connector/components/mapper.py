@@ -646,11 +646,11 @@ class Mapper(AbstractComponent):
     # pylint: disable=W8110
     @classmethod
     def _complete_component_build(cls):
-        super(Mapper, cls)._complete_component_build()
+        super()._complete_component_build()
         cls._build_mapper_component()
 
     def __init__(self, work):
-        super(Mapper, self).__init__(work)
+        super().__init__(work)
         self._options = None
 
     def _map_direct(self, record, from_attr, to_attr):
@@ -1043,7 +1043,7 @@ class MapOptions(dict):
 
     def __getitem__(self, key):
         try:
-            return super(MapOptions, self).__getitem__(key)
+            return super().__getitem__(key)
         except KeyError:
             return None
 
@@ -43,7 +43,7 @@ class Synchronizer(AbstractComponent):
     _base_backend_adapter_usage = "backend.adapter"
 
     def __init__(self, work_context):
-        super(Synchronizer, self).__init__(work_context)
+        super().__init__(work_context)
         self._backend_adapter = None
         self._binder = None
         self._mapper = None
@@ -119,7 +119,7 @@ class GenericExporter(AbstractComponent):
     _default_binding_field = None
 
     def __init__(self, working_context):
-        super(GenericExporter, self).__init__(working_context)
+        super().__init__(working_context)
         self.binding = None
         self.external_id = None
 
@@ -300,16 +300,16 @@ class GenericExporter(AbstractComponent):
         :param relation: record to export if not already exported
         :type relation: :py:class:`odoo.models.BaseModel`
         :param binding_model: name of the binding model for the relation
-        :type binding_model: str | unicode
+        :type binding_model: str
         :param component_usage: 'usage' to look for to find the Component to
                                 for the export, by default 'record.exporter'
-        :type exporter: str | unicode
+        :type exporter: str
         :param binding_field: name of the one2many field on a normal
                               record that points to the binding record
                               (default: my_backend_bind_ids).
                               It is used only when the relation is not
                               a binding but is a normal record.
-        :type binding_field: str | unicode
+        :type binding_field: str
         :binding_extra_vals:  In case we want to create a new binding
                               pass extra values for this binding
         :type binding_extra_vals: dict